@@ -1,6 +1,9 @@
+import collections
 import enum
+import operator
 import pathlib
-import re
+import string
+import sys
 import typing
 from typing import Union
 
@@ -8,6 +11,9 @@ from typing import Union
 V1_PRIMERNAME = r"^[a-zA-Z0-9\-]+_[0-9]+_(LEFT|RIGHT)(_ALT[0-9]*|_alt[0-9]*)*$"
 V2_PRIMERNAME = r"^[a-zA-Z0-9\-]+_[0-9]+_(LEFT|RIGHT)_[0-9]+$"
 
+# Characters allowed in the primername prefix
+_PREFIX_CHARS = frozenset(string.ascii_letters + string.digits + "-")
+
 
 class PrimerNameVersion(enum.Enum):
     INVALID = 0
@@ -15,25 +21,65 @@ class PrimerNameVersion(enum.Enum):
     V2 = 2
 
 
+def _is_ascii_digits(s: str) -> bool:
+    # str.isdigit() alone accepts non-ascii digits such as "²"
+    return s.isascii() and s.isdigit()
+
+
+def _scan_primername(primername: str) -> tuple[PrimerNameVersion, list[str]]:
+    """
+    Return the version of a primername and its "_" separated parts.
+    Equivalent to matching V1_PRIMERNAME then V2_PRIMERNAME, using a single split.
+    """
+    if not isinstance(primername, str):
+        return PrimerNameVersion.INVALID, []
+    parts = primername.split("_")
+    if len(parts) < 3:
+        return PrimerNameVersion.INVALID, parts
+
+    prefix, amplicon_number, side, *suffixes = parts
+    if (
+        not prefix
+        or not _PREFIX_CHARS.issuperset(prefix)
+        or not _is_ascii_digits(amplicon_number)
+        or side not in ("LEFT", "RIGHT")
+    ):
+        return PrimerNameVersion.INVALID, parts
+
+    # v2 has a single numeric suffix
+    if len(suffixes) == 1 and _is_ascii_digits(suffixes[0]):
+        return PrimerNameVersion.V2, parts
+
+    # v1 has zero or more (_alt|_ALT)[0-9]* suffixes
+    for suffix in suffixes:
+        if suffix[:3] not in ("alt", "ALT"):
+            return PrimerNameVersion.INVALID, parts
+        if suffix[3:] and not _is_ascii_digits(suffix[3:]):
+            return PrimerNameVersion.INVALID, parts
+    return PrimerNameVersion.V1, parts
+
+
 def version_primername(primername: str) -> PrimerNameVersion:
     """
     Check the version of a primername.
     """
-    if re.match(V1_PRIMERNAME, primername):
-        return PrimerNameVersion.V1
-    elif re.match(V2_PRIMERNAME, primername):
-        return PrimerNameVersion.V2
-    else:
-        return PrimerNameVersion.INVALID
+    return _scan_primername(primername)[0]
 
 
 def check_primername(primername: str) -> bool:
     """
     Check if a primername is valid.
     """
-    return bool(
-        re.match(V1_PRIMERNAME, primername) or re.match(V2_PRIMERNAME, primername)
-    )
+    return version_primername(primername) != PrimerNameVersion.INVALID
+
+
+def _split_primername(primername: str) -> tuple[str, int]:
+    """
+    Return the (amplicon_prefix, amplicon_number) of a primername.
+    Only needed for primernames set without validation (validate=False).
+    """
+    parts = primername.split("_", 2)
+    return parts[0], int(parts[1])
 
 
 class StrandEnum(enum.Enum):
@@ -41,6 +87,76 @@ class StrandEnum(enum.Enum):
     REVERSE = "-"
 
 
+# Plain str values, to skip the enum member lookups in hot loops
+_FORWARD_STRAND = sys.intern(StrandEnum.FORWARD.value)
+_REVERSE_STRAND = sys.intern(StrandEnum.REVERSE.value)
+# Valid strand str -> canonical constant, built once rather than per assignment
+_STRAND_VALUES = {_FORWARD_STRAND: _FORWARD_STRAND, _REVERSE_STRAND: _REVERSE_STRAND}
+
+
+# Field checks shared by the BedLine setters and create_bedline.
+# Each returns the converted value or raises ValueError.
+def _parse_int(name: str, v) -> int:
+    try:
+        return int(v)
+    except ValueError as e:
+        raise ValueError(f"{name} must be an int. Got ({v})") from e
+
+
+def _check_position(name: str, v) -> int:
+    v = _parse_int(name, v)
+    if v < 0:
+        raise ValueError(f"{name} must be greater than or equal to 0. Got ({v})")
+    return v
+
+
+def _check_primername(v) -> tuple[str, int]:
+    """
+    Return the (amplicon_prefix, amplicon_number) of a valid primername.
+    """
+    version, parts = _scan_primername(v)
+    if version == PrimerNameVersion.INVALID:
+        raise ValueError(f"Invalid primername: ({v}). Must be in v1 or v2 format")
+    # Reuse the split from validation
+    return parts[0], int(parts[1])
+
+
+def _check_pool(v) -> int:
+    v = _parse_int("pool", v)
+    if v < 1:
+        raise ValueError(f"pool is 1-based pos int pool number. Got ({v})")
+    return v
+
+
+def _check_strand(v) -> str:
+    try:
+        v = str(v)
+    except ValueError as e:
+        raise ValueError(f"strand must be a str. Got ({v})") from e
+
+    # Return the shared constant, so comparisons hit the identity fast path
+    strand = _STRAND_VALUES.get(v)
+    if strand is None:
+        raise ValueError(f"strand must be a str of ({list(_STRAND_VALUES)}). Got ({v})")
+    return strand
+
+
+def _check_weight(v: Union[float, str, int, None]) -> Union[float, None]:
+    # Catch Empty and None
+    if v is None or v == "":
+        return None
+
+    try:
+        v = float(v)
+    except ValueError as e:
+        raise ValueError(
+            f"weight must be a float, None or empty str (''). Got ({v})"
+        ) from e
+    if v < 0:
+        raise ValueError(f"weight must be greater than or equal to 0. Got ({v})")
+    return v
+
+
 class BedLine:
     """
     A BedLine object represents a single line in a BED file.
@@ -55,6 +171,21 @@ class BedLine:
     - sequence : str
     """
 
+    # Slots avoid a per-instance __dict__ for the one object created per BED row
+    __slots__ = (
+        "_chrom",
+        "_start",
+        "_end",
+        "_primername",
+        "_pool",
+        "_strand",
+        "_sequence",
+        "_weight",
+        "_amplicon_prefix",
+        "_amplicon_number",
+        "_bed",
+    )
+
     # properties
     _chrom: str
     _start: int
@@ -64,6 +195,11 @@ class BedLine:
     _strand: str
     _sequence: str
     _weight: Union[float, None]
+    # parsed from primername on first use
+    _amplicon_prefix: Union[str, None]
+    _amplicon_number: Union[int, None]
+    # to_bed() output, cleared by every setter
+    _bed: Union[str, None]
 
     def __init__(
         self,
@@ -85,6 +221,46 @@ class BedLine:
         self.sequence = sequence
         self.weight = weight
 
+    @classmethod
+    def _from_trusted(
+        cls,
+        chrom: str,
+        start: int,
+        end: int,
+        primername: str,
+        pool: int,
+        strand: str,
+        sequence: str,
+        weight: Union[float, None] = None,
+        amplicon_prefix: Union[str, None] = None,
+        amplicon_number: Union[int, None] = None,
+    ) -> "BedLine":
+        """
+        Create a BedLine from already checked values, bypassing the property setters.
+        The strand must be one of the _STRAND_VALUES constants.
+        """
+        bedline = cls.__new__(cls)
+        bedline._chrom = sys.intern(chrom)
+        bedline._start = start
+        bedline._end = end
+        bedline._set_primername(primername, amplicon_prefix, amplicon_number)
+        bedline._pool = pool
+        bedline._strand = strand
+        bedline._sequence = sequence.upper()
+        bedline._weight = weight
+        bedline._bed = None
+        return bedline
+
+    def clone(self) -> "BedLine":
+        """
+        Return a copy of this BedLine. The values are already valid, so are copied without re-validation.
+        """
+        bedline = self.__class__.__new__(self.__class__)
+        # Copy every slot, so fields added to __slots__ are never left unset
+        for slot in BedLine.__slots__:
+            setattr(bedline, slot, getattr(self, slot))
+        return bedline
+
     @property
     def chrom(self):
         return self._chrom
@@ -95,7 +271,9 @@ class BedLine:
             v = str(v)
         except ValueError as e:
             raise ValueError(f"chrom must be a str. Got ({v})") from e
-        self._chrom = v
+        # Few distinct chroms, so share one string object for faster grouping
+        self._chrom = sys.intern(v)
+        self._bed = None
 
     @property
     def start(self):
@@ -103,13 +281,8 @@ class BedLine:
 
     @start.setter
     def start(self, v):
-        try:
-            v = int(v)
-        except ValueError as e:
-            raise ValueError(f"start must be an int. Got ({v})") from e
-        if v < 0:
-            raise ValueError(f"start must be greater than or equal to 0. Got ({v})")
-        self._start = v
+        self._start = _check_position("start", v)
+        self._bed = None
 
     @property
     def end(self):
@@ -117,13 +290,8 @@ class BedLine:
 
     @end.setter
     def end(self, v):
-        try:
-            v = int(v)
-        except ValueError as e:
-            raise ValueError(f"end must be an int. Got ({v})") from e
-        if v < 0:
-            raise ValueError(f"end must be greater than or equal to 0. Got ({v})")
-        self._end = v
+        self._end = _check_position("end", v)
+        self._bed = None
 
     @property
     def primername(self):
@@ -131,9 +299,29 @@ class BedLine:
 
     @primername.setter
     def primername(self, v):
-        if version_primername(v) == PrimerNameVersion.INVALID:
-            raise ValueError(f"Invalid primername: ({v}). Must be in v1 or v2 format")
+        self._amplicon_prefix, self._amplicon_number = _check_primername(v)
         self._primername = v
+        self._bed = None
+
+    def _set_primername(
+        self,
+        v: str,
+        amplicon_prefix: Union[str, None] = None,
+        amplicon_number: Union[int, None] = None,
+    ):
+        """
+        Set the primername without validation.
+        The parsed values are cleared unless the caller already knows them.
+        """
+        self._primername = v
+        self._amplicon_prefix = amplicon_prefix
+        self._amplicon_number = amplicon_number
+        self._bed = None
+
+    def _parse_primername(self):
+        self._amplicon_prefix, self._amplicon_number = _split_primername(
+            self._primername
+        )
 
     @property
     def pool(self):
@@ -141,13 +329,8 @@ class BedLine:
 
     @pool.setter
     def pool(self, v):
-        try:
-            v = int(v)
-        except ValueError as e:
-            raise ValueError(f"pool must be an int. Got ({v})") from e
-        if v < 1:
-            raise ValueError(f"pool is 1-based pos int pool number. Got ({v})")
-        self._pool = v
+        self._pool = _check_pool(v)
+        self._bed = None
 
     @property
     def strand(self):
@@ -155,16 +338,8 @@ class BedLine:
 
     @strand.setter
     def strand(self, v):
-        try:
-            v = str(v)
-        except ValueError as e:
-            raise ValueError(f"strand must be a str. Got ({v})") from e
-
-        if v not in {x.value for x in StrandEnum}:
-            raise ValueError(
-                f"strand must be a str of ({[x.value for x in StrandEnum]}). Got ({v})"
-            )
-        self._strand = v
+        self._strand = _check_strand(v)
+        self._bed = None
 
     @property
     def sequence(self):
@@ -175,6 +350,7 @@ class BedLine:
         if not isinstance(v, str):
             raise ValueError(f"sequence must be a str. Got ({v})")
         self._sequence = v.upper()
+        self._bed = None
 
     @property
     def weight(self):
@@ -182,20 +358,8 @@ class BedLine:
 
     @weight.setter
     def weight(self, v: Union[float, str, int, None]):
-        # Catch Empty and None
-        if v is None or v == "":
-            self._weight = None
-            return
-
-        try:
-            v = float(v)
-        except ValueError as e:
-            raise ValueError(
-                f"weight must be a float, None or empty str (''). Got ({v})"
-            ) from e
-        if v < 0:
-            raise ValueError(f"weight must be greater than or equal to 0. Got ({v})")
-        self._weight = v
+        self._weight = _check_weight(v)
+        self._bed = None
 
     # calculated properties
     @property
@@ -208,11 +372,15 @@ class BedLine:
 
     @property
     def amplicon_number(self) -> int:
-        return int(self.primername.split("_")[1])
+        if self._amplicon_number is None:
+            self._parse_primername()
+        return self._amplicon_number  # type: ignore
 
     @property
     def amplicon_prefix(self) -> str:
-        return self.primername.split("_")[0]
+        if self._amplicon_prefix is None:
+            self._parse_primername()
+        return self._amplicon_prefix  # type: ignore
 
     @property
     def ipool(self) -> int:
@@ -220,9 +388,13 @@ class BedLine:
         return self.pool - 1
 
     def to_bed(self) -> str:
+        if self._bed is not None:
+            return self._bed
         # If a weight is provided print. Else print empty string
-        weight_str = "" if self.weight is None else f"\t{self.weight}"
-        return f"{self.chrom}\t{self.start}\t{self.end}\t{self.primername}\t{self.pool}\t{self.strand}\t{self.sequence}{weight_str}\n"
+        weight_str = "" if self._weight is None else f"\t{self._weight}"
+        # Read the backing fields directly, skipping the property calls
+        self._bed = f"{self._chrom}\t{self._start}\t{self._end}\t{self._primername}\t{self._pool}\t{self._strand}\t{self._sequence}{weight_str}\n"
+        return self._bed
 
 
 class BedLineParser:
@@ -233,22 +405,27 @@ class BedLineParser:
     @staticmethod
     def from_file(
         bedfile: typing.Union[str, pathlib.Path],
+        validate: bool = True,
     ) -> tuple[list[str], list[BedLine]]:
         """
         Read and parse a BED file and return a tuple of headers and BedLine objects.
         : param bedfile: typing.Union[str, pathlib.Path]
+        : param validate: bool. If False, skip validation
         : return: tuple[list[str], list[BedLine]]
         """
-        return read_bedfile(bedfile=bedfile)
+        return read_bedfile(bedfile=bedfile, validate=validate)
 
     @staticmethod
-    def from_str(bedfile_str: str) -> tuple[list[str], list[BedLine]]:
+    def from_str(
+        bedfile_str: str, validate: bool = True
+    ) -> tuple[list[str], list[BedLine]]:
         """
         Parse a BED string and return a tuple of headers and BedLine objects.
         : param bedfile_str: str
+        : param validate: bool. If False, skip validation
         : return: tuple[list[str], list[BedLine]]
         """
-        return bedline_from_str(bedfile_str)
+        return bedline_from_str(bedfile_str, validate=validate)
 
     @staticmethod
     def to_str(headers: typing.Optional[list[str]], bedlines: list[BedLine]) -> str:
@@ -275,7 +452,7 @@ class BedLineParser:
         write_bedfile(bedfile, headers, bedlines)
 
 
-def create_bedline(bedline: list[str]) -> BedLine:
+def create_bedline(bedline: list[str], validate: bool = True) -> BedLine:
     """
     Creates a BedLine object from a list of string values.
 
@@ -288,6 +465,8 @@ def create_bedline(bedline: list[str]) -> BedLine:
         - pool: str, the pool number (will be converted to int)
         - strand: str, the strand ('+' or '-')
         - sequence: str, the sequence of the primer
+    :param validate: bool
+        If False, the primername is not validated. Only use for trusted input.
 
     :return: BedLine
         A BedLine object created from the provided values.
@@ -297,69 +476,101 @@ def create_bedline(bedline: list[str]) -> BedLine:
     :raises IndexError:
         If the provided list does not contain the correct number of elements.
     """
-    try:
-        if len(bedline) < 8:
-            weight = None
-        else:
-            weight = float(bedline[7])
-
-        return BedLine(
-            chrom=bedline[0],
-            start=bedline[1],
-            end=bedline[2],
-            primername=bedline[3],
-            pool=bedline[4],
-            strand=bedline[5],
-            sequence=bedline[6],
-            weight=weight,
-        )
-    except IndexError as a:
+    if len(bedline) < 7:
         raise IndexError(
             f"Invalid BED line value: ({bedline}): has incorrect number of columns"
-        ) from a
+        )
+    # Unpack once, rather than indexing each column
+    chrom, start, end, primername, pool, strand, sequence = bedline[:7]
+
+    # Check each column once with the setters' helpers, in BedLine.__init__ order
+    start = _check_position("start", start)
+    end = _check_position("end", end)
+    amplicon_prefix = amplicon_number = None
+    if validate:
+        amplicon_prefix, amplicon_number = _check_primername(primername)
+    pool = _check_pool(pool)
+    strand = _check_strand(strand)
+    weight = _check_weight(bedline[7]) if len(bedline) > 7 else None
+
+    return BedLine._from_trusted(
+        chrom,
+        start,
+        end,
+        primername,
+        pool,
+        strand,
+        sequence,
+        weight,
+        amplicon_prefix,
+        amplicon_number,
+    )
 
 
-def bedline_from_str(bedline_str: str) -> tuple[list[str], list[BedLine]]:
+def parse_bedfile_lines(
+    lines: typing.Iterable[str], validate: bool = True
+) -> tuple[list[str], list[BedLine]]:
     """
-    Create a list of BedLine objects from a BED string.
+    Parse an iterable of BED lines (such as an open file) into headers and BedLine objects.
+    Lines are consumed one at a time, so the input is never held in memory at once.
     """
     headers = []
     bedlines = []
-    for line in bedline_str.strip().split("\n"):
+    for line in lines:
         line = line.strip()
 
         # Handle headers
         if line.startswith("#"):
             headers.append(line)
         elif line:
-            bedlines.append(create_bedline(line.split("\t")))
+            bedlines.append(create_bedline(line.split("\t"), validate=validate))
 
     return headers, bedlines
 
 
+def bedline_from_str(
+    bedline_str: str, validate: bool = True
+) -> tuple[list[str], list[BedLine]]:
+    """
+    Create a list of BedLine objects from a BED string.
+    Set validate=False to skip validation for trusted input.
+    """
+    # A leading byte order mark would hide the first header's "#"
+    bedline_str = bedline_str.lstrip("\ufeff")
+    # Lines are stripped and blank lines skipped by the parser, so no full strip() copy
+    return parse_bedfile_lines(bedline_str.splitlines(), validate=validate)
+
+
 def read_bedfile(
     bedfile: typing.Union[str, pathlib.Path],
+    validate: bool = True,
 ) -> tuple[list[str], list[BedLine]]:
-    with open(bedfile) as f:
-        text = f.read()
-        return bedline_from_str(text)
+    # utf-8-sig drops a leading byte order mark, if present
+    with open(bedfile, encoding="utf-8-sig") as f:
+        return parse_bedfile_lines(f, validate=validate)
 
 
-def create_bedfile_str(
+def iter_bedfile_lines(
     headers: typing.Optional[list[str]], bedlines: list[BedLine]
-) -> str:
-    bedfile_str: list[str] = []
+) -> typing.Iterator[str]:
+    """
+    Yield each line of a BED file (including the newline), headers first.
+    """
     if headers:
         for header in headers:
             # add # if not present
             if not header.startswith("#"):
                 header = "#" + header
-            bedfile_str.append(header + "\n")
+            yield header + "\n"
     # Add bedlines
     for bedline in bedlines:
-        bedfile_str.append(bedline.to_bed())
+        yield bedline.to_bed()
 
-    return "".join(bedfile_str)
+
+def create_bedfile_str(
+    headers: typing.Optional[list[str]], bedlines: list[BedLine]
+) -> str:
+    return "".join(iter_bedfile_lines(headers, bedlines))
 
 
 def write_bedfile(
@@ -367,32 +578,40 @@ def write_bedfile(
     headers: typing.Optional[list[str]],
     bedlines: list[BedLine],
 ):
-    with open(bedfile, "w") as f:
-        f.write(create_bedfile_str(headers, bedlines))
+    # Stream the lines rather than building the whole file in memory
+    with open(bedfile, "w", encoding="utf-8") as f:
+        f.writelines(iter_bedfile_lines(headers, bedlines))
+
+
+_CHROM_KEY = operator.attrgetter("chrom")
+_AMPLICON_NUMBER_KEY = operator.attrgetter("amplicon_number")
+_STRAND_KEY = operator.attrgetter("strand")
+
+
+def _group_by(
+    list_bedlines: list[BedLine], key: typing.Callable[[BedLine], typing.Any]
+) -> dict:
+    """
+    Group a list of BedLine objects by key(bedline), keeping first-seen order.
+    """
+    bedlines_dict = collections.defaultdict(list)
+    for bedline in list_bedlines:
+        bedlines_dict[key(bedline)].append(bedline)
+    return dict(bedlines_dict)
 
 
 def group_by_chrom(list_bedlines: list[BedLine]) -> dict[str, list[BedLine]]:
     """
     Group a list of BedLine objects by chrom attribute.
     """
-    bedlines_dict = {}
-    for bedline in list_bedlines:
-        if bedline.chrom not in bedlines_dict:
-            bedlines_dict[bedline.chrom] = []
-        bedlines_dict[bedline.chrom].append(bedline)
-    return bedlines_dict
+    return _group_by(list_bedlines, _CHROM_KEY)
 
 
 def group_by_amplicon_number(list_bedlines: list[BedLine]) -> dict[int, list[BedLine]]:
     """
     Group a list of BedLine objects by amplicon number.
     """
-    bedlines_dict = {}
-    for bedline in list_bedlines:
-        if bedline.amplicon_number not in bedlines_dict:
-            bedlines_dict[bedline.amplicon_number] = []
-        bedlines_dict[bedline.amplicon_number].append(bedline)
-    return bedlines_dict
+    return _group_by(list_bedlines, _AMPLICON_NUMBER_KEY)
 
 
 def group_by_strand(
@@ -401,12 +620,11 @@ def group_by_strand(
     """
     Group a list of BedLine objects by strand.
     """
-    bedlines_dict = {}
-    for bedline in list_bedlines:
-        if bedline.strand not in bedlines_dict:
-            bedlines_dict[bedline.strand] = []
-        bedlines_dict[bedline.strand].append(bedline)
-    return bedlines_dict
+    return _group_by(list_bedlines, _STRAND_KEY)
+
+
+# Position of each strand in a (forward, reverse) primer pair
+_STRAND_INDEX = {_FORWARD_STRAND: 0, _REVERSE_STRAND: 1}
 
 
 def group_primer_pairs(
@@ -416,24 +634,28 @@ def group_primer_pairs(
     Generate primer pairs from a list of BedLine objects.
     Groups by chrom, then by amplicon number, then pairs forward and reverse primers.
     """
-    primer_pairs = []
-
-    # Group by chrom
-    for chrom_bedlines in group_by_chrom(bedlines).values():
-        # Group by amplicon number
-        for amplicon_number_bedlines in group_by_amplicon_number(
-            chrom_bedlines
-        ).values():
-            # Generate primer pairs
-            strand_to_bedlines = group_by_strand(amplicon_number_bedlines)
-            primer_pairs.append(
-                (
-                    strand_to_bedlines.get(StrandEnum.FORWARD.value, []),
-                    strand_to_bedlines.get(StrandEnum.REVERSE.value, []),
-                )
-            )
+    # chrom -> amplicon number -> (forward, reverse). Built in one pass, the
+    # nested dicts keep the pairs in chrom then amplicon first-seen order.
+    chrom_to_pairs: dict[str, dict[int, tuple[list[BedLine], list[BedLine]]]] = {}
+    for bedline in bedlines:
+        amplicon_to_pairs = chrom_to_pairs.setdefault(bedline.chrom, {})
+        pair = amplicon_to_pairs.get(bedline.amplicon_number)
+        if pair is None:
+            pair = ([], [])
+            amplicon_to_pairs[bedline.amplicon_number] = pair
+
+        pair[_STRAND_INDEX[bedline.strand]].append(bedline)
+
+    return [
+        pair
+        for amplicon_to_pairs in chrom_to_pairs.values()
+        for pair in amplicon_to_pairs.values()
+    ]
+
 
-    return primer_pairs
+# C-level sort key, cheaper than a lambda
+# Reads the backing field, skipping the property call
+_SEQUENCE_KEY = operator.attrgetter("_sequence")
 
 
 def update_primernames(bedlines: list[BedLine]) -> list[BedLine]:
@@ -445,18 +667,16 @@ def update_primernames(bedlines: list[BedLine]) -> list[BedLine]:
 
     # Update the primer names
     for fbedlines, rbedlines in primer_pairs:
-        # Sort the bedlines by sequence
-        fbedlines.sort(key=lambda x: x.sequence)
-        for i, bedline in enumerate(fbedlines, start=1):
-            bedline.primername = (
-                f"{bedline.amplicon_prefix}_{bedline.amplicon_number}_LEFT_{i}"
-            )
-
-        rbedlines.sort(key=lambda x: x.sequence)
-        for i, bedline in enumerate(rbedlines, start=1):
-            bedline.primername = (
-                f"{bedline.amplicon_prefix}_{bedline.amplicon_number}_RIGHT_{i}"
-            )
+        for side_bedlines, side in ((fbedlines, "LEFT"), (rbedlines, "RIGHT")):
+            # Sort the bedlines by sequence
+            if len(side_bedlines) > 1:
+                side_bedlines.sort(key=_SEQUENCE_KEY)
+            for i, bedline in enumerate(side_bedlines, start=1):
+                prefix = bedline.amplicon_prefix
+                number = bedline.amplicon_number
+                # Built from a valid primername, so skip re-validation.
+                # The prefix and number are unchanged, so keep them parsed
+                bedline._set_primername(f"{prefix}_{number}_{side}_{i}", prefix, number)
 
     return bedlines
 
@@ -470,35 +690,48 @@ def downgrade_primernames(bedlines: list[BedLine]) -> list[BedLine]:
 
     # Update the primer names
     for fbedlines, rbedlines in primer_pairs:
-        # Sort the bedlines by sequence
-        fbedlines.sort(key=lambda x: x.sequence)
-        for i, bedline in enumerate(fbedlines, start=1):
-            alt = "" if i == 1 else f"_alt{i-1}"
-            bedline.primername = (
-                f"{bedline.amplicon_prefix}_{bedline.amplicon_number}_LEFT{alt}"
-            )
-
-        rbedlines.sort(key=lambda x: x.sequence)
-        for i, bedline in enumerate(rbedlines, start=1):
-            alt = "" if i == 1 else f"_alt{i-1}"
-            bedline.primername = (
-                f"{bedline.amplicon_prefix}_{bedline.amplicon_number}_RIGHT{alt}"
-            )
+        for side_bedlines, side in ((fbedlines, "LEFT"), (rbedlines, "RIGHT")):
+            # Sort the bedlines by sequence
+            if len(side_bedlines) > 1:
+                side_bedlines.sort(key=_SEQUENCE_KEY)
+            for i, bedline in enumerate(side_bedlines, start=1):
+                prefix = bedline.amplicon_prefix
+                number = bedline.amplicon_number
+                alt = "" if i == 1 else f"_alt{i - 1}"
+                bedline._set_primername(
+                    f"{prefix}_{number}_{side}{alt}", prefix, number
+                )
 
     return bedlines
 
 
+# "+" sorts before "-", so forward primers come before reverse primers
+_BEDLINE_SORT_KEY = operator.attrgetter("chrom", "amplicon_number", "strand")
+
+
 def sort_bedlines(bedlines: list[BedLine]) -> list[BedLine]:
     """
-    Sorts bedlines by chrom, start, end, primername.
+    Sorts bedlines by chrom, amplicon number, then strand (forward first).
+    Bedlines with equal keys keep their input order.
     """
-    primerpairs = group_primer_pairs(bedlines)
-    primerpairs.sort(key=lambda x: (x[0][0].chrom, x[0][0].amplicon_number))
-    return [
-        bedline
-        for fbedlines, rbedlines in primerpairs
-        for bedline in fbedlines + rbedlines
-    ]
+    return sorted(bedlines, key=_BEDLINE_SORT_KEY)
+
+
+def _merge_bounds(bedlines: list[BedLine]) -> tuple[int, int, str]:
+    """
+    Return the smallest start, largest end and (first) longest sequence in one pass.
+    """
+    start = bedlines[0].start
+    end = bedlines[0].end
+    sequence = bedlines[0].sequence
+    for bedline in bedlines[1:]:
+        if bedline.start < start:
+            start = bedline.start
+        if bedline.end > end:
+            end = bedline.end
+        if len(bedline.sequence) > len(sequence):
+            sequence = bedline.sequence
+    return start, end, sequence
 
 
 def merge_bedlines(bedlines: list[BedLine]) -> list[BedLine]:
@@ -510,11 +743,7 @@ def merge_bedlines(bedlines: list[BedLine]) -> list[BedLine]:
     for fbedlines, rbedlines in group_primer_pairs(bedlines):
         # Merge forward primers
         if fbedlines:
-            fbedline_start = min([bedline.start for bedline in fbedlines])
-            fbedline_end = max([bedline.end for bedline in fbedlines])
-            fbedline_sequence = max(
-                [bedline.sequence for bedline in fbedlines], key=len
-            )
+            fbedline_start, fbedline_end, fbedline_sequence = _merge_bounds(fbedlines)
             merged_bedlines.append(
                 BedLine(
                     chrom=fbedlines[0].chrom,
@@ -522,18 +751,14 @@ def merge_bedlines(bedlines: list[BedLine]) -> list[BedLine]:
                     end=fbedline_end,
                     primername=f"{fbedlines[0].amplicon_prefix}_{fbedlines[0].amplicon_number}_LEFT_1",
                     pool=fbedlines[0].pool,
-                    strand=StrandEnum.FORWARD.value,
+                    strand=_FORWARD_STRAND,
                     sequence=fbedline_sequence,
                 )
             )
 
         # Merge reverse primers
         if rbedlines:
-            rbedline_start = min([bedline.start for bedline in rbedlines])
-            rbedline_end = max([bedline.end for bedline in rbedlines])
-            rbedline_sequence = max(
-                [bedline.sequence for bedline in rbedlines], key=len
-            )
+            rbedline_start, rbedline_end, rbedline_sequence = _merge_bounds(rbedlines)
 
             merged_bedlines.append(
                 BedLine(
@@ -542,7 +767,7 @@ def merge_bedlines(bedlines: list[BedLine]) -> list[BedLine]:
                     end=rbedline_end,
                     primername=f"{rbedlines[0].amplicon_prefix}_{rbedlines[0].amplicon_number}_RIGHT_1",
                     pool=rbedlines[0].pool,
-                    strand=StrandEnum.REVERSE.value,
+                    strand=_REVERSE_STRAND,
                     sequence=rbedline_sequence,
                 )
             )
@@ -568,7 +793,8 @@ class BedFileModifier:
         bedlines: list[BedLine],
     ) -> list[BedLine]:
         """
-        Sorts the bedlines by chrom, amplicon number, direction, and sequence.
+        Sorts the bedlines by chrom, amplicon number, then strand (forward first).
+        Bedlines with equal keys keep their input order.
         """
         return sort_bedlines(bedlines)
 
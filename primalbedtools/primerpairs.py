@@ -1,3 +1,5 @@
+from itertools import chain
+
 from primalbedtools.bedfiles import BedLine, group_primer_pairs
 
 
@@ -19,44 +21,46 @@ class PrimerPair:
         self.fbedlines = fbedlines
         self.rbedlines = rbedlines
 
-        all_lines = fbedlines + rbedlines
+        # Check both forward and reverse primers are present
+        if not self.fbedlines:
+            raise ValueError("No forward primers found")
+        if not self.rbedlines:
+            raise ValueError("No reverse primers found")
+
+        first = fbedlines[0]
+        self.chrom = first.chrom
+        self.pool = first.pool
+        self.amplicon_number = first.amplicon_number
+
+        # Check all chrom, pools and amplicon numbers are the same in one pass
+        prefixes = set()
+        for bedline in chain(fbedlines, rbedlines):
+            prefixes.add(bedline.amplicon_prefix)
+            if bedline.chrom != self.chrom:
+                chroms = {bl.chrom for bl in chain(fbedlines, rbedlines)}
+                raise ValueError(
+                    f"All bedlines must be on the same chromosome ({','.join(chroms)})"
+                )
+            if bedline.pool != self.pool:
+                pools = {bl.pool for bl in chain(fbedlines, rbedlines)}
+                raise ValueError(
+                    f"All bedlines must be in the same pool ({','.join(map(str, pools))})"
+                )
+            if bedline.amplicon_number != self.amplicon_number:
+                amplicon_numbers = {
+                    bl.amplicon_number for bl in chain(fbedlines, rbedlines)
+                }
+                raise ValueError(
+                    f"All bedlines must be the same amplicon ({','.join(map(str, amplicon_numbers))})"
+                )
 
         # All prefixes must be the same
-        prefixes = set([bedline.amplicon_prefix for bedline in all_lines])
         if len(prefixes) != 1:
             print(
                 f"All bedlines must have the same prefix ({','.join(prefixes)}). Using the first one."
             )
         self.prefix = sorted(prefixes)[0]
 
-        # Check all chrom are the same
-        chroms = set([bedline.chrom for bedline in all_lines])
-        if len(chroms) != 1:
-            raise ValueError(
-                f"All bedlines must be on the same chromosome ({','.join(chroms)})"
-            )
-        self.chrom = chroms.pop()
-        # Check all pools are the same
-        pools = set([bedline.pool for bedline in all_lines])
-        if len(pools) != 1:
-            raise ValueError(
-                f"All bedlines must be in the same pool ({','.join(map(str, pools))})"
-            )
-        self.pool = pools.pop()
-        # Check all amplicon numbers are the same
-        amplicon_numbers = set([bedline.amplicon_number for bedline in all_lines])
-        if len(amplicon_numbers) != 1:
-            raise ValueError(
-                f"All bedlines must be the same amplicon ({','.join(map(str, amplicon_numbers))})"
-            )
-        self.amplicon_number = amplicon_numbers.pop()
-
-        # Check both forward and reverse primers are present
-        if not self.fbedlines:
-            raise ValueError("No forward primers found")
-        if not self.rbedlines:
-            raise ValueError("No reverse primers found")
-
     @property
     def ipool(self) -> int:
         """Return the 0-based pool number"""
@@ -1,12 +1,17 @@
-import copy
+import functools
 import pathlib
 import random
+import re
+import tempfile
 import unittest
 
 from primalbedtools.bedfiles import (
+    V1_PRIMERNAME,
+    V2_PRIMERNAME,
     BedLine,
     BedLineParser,
     PrimerNameVersion,
+    check_primername,
     create_bedfile_str,
     create_bedline,
     downgrade_primernames,
@@ -14,6 +19,7 @@ from primalbedtools.bedfiles import (
     group_by_chrom,
     group_by_strand,
     merge_bedlines,
+    parse_bedfile_lines,
     read_bedfile,
     sort_bedlines,
     update_primernames,
@@ -25,147 +31,172 @@ TEST_BEDFILE = pathlib.Path(__file__).parent / "test.bed"
 TEST_V2_BEDFILE = pathlib.Path(__file__).parent / "test.v2.bed"
 TEST_WEIGHTS_BEDFILE = pathlib.Path(__file__).parent / "test.weights.bed"
 
+DEFAULT_BEDLINE_KWARGS = {
+    "chrom": "chr1",
+    "start": 100,
+    "end": 200,
+    "primername": "scheme_1_LEFT",
+    "pool": 1,
+    "strand": "+",
+    "sequence": "ACGT",
+}
+
+
+@functools.cache
+def _read_bedfile_cached(
+    bedfile: pathlib.Path,
+) -> tuple[tuple[str, ...], tuple[BedLine, ...]]:
+    """
+    Parse each test BED file once per run. Use _read_test_bedfile for a copy to work on
+    """
+    headers, bedlines = read_bedfile(bedfile)
+    return tuple(headers), tuple(bedlines)
+
+
+def _read_test_bedfile(bedfile: pathlib.Path) -> tuple[list[str], list[BedLine]]:
+    headers, bedlines = _read_bedfile_cached(bedfile)
+    # Clones, so tests can't change the cached BedLines
+    return list(headers), [bedline.clone() for bedline in bedlines]
+
+
+# Provided and derived BedLine attributes, compared as one dict
+BEDLINE_FIELDS = (
+    "chrom",
+    "start",
+    "end",
+    "primername",
+    "pool",
+    "strand",
+    "sequence",
+    "weight",
+    "length",
+    "amplicon_number",
+    "amplicon_prefix",
+    "ipool",
+)
+
+
+def _bedline_fields(bedline: BedLine) -> dict:
+    return {field: getattr(bedline, field) for field in BEDLINE_FIELDS}
+
+
+def _make_bedline(**overrides) -> BedLine:
+    """
+    Create a valid BedLine, with any field overridden
+    """
+    return BedLine(**{**DEFAULT_BEDLINE_KWARGS, **overrides})
+
+
+class _TempOutputMixin:
+    """
+    Give a TestCase class an output_bed_path in a temporary directory.
+    The directory is removed with all its contents after the class.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._tmpdir = tempfile.TemporaryDirectory()
+        cls.output_bed_path = pathlib.Path(cls._tmpdir.name) / "test_output.bed"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmpdir.cleanup()
+        super().tearDownClass()
+
 
 class TestBedLine(unittest.TestCase):
     def test_bedline_create(self):
-        bedline = BedLine(
-            chrom="chr1",
-            start=100,
-            end=200,
-            primername="scheme_1_LEFT",
-            pool=1,
-            strand="+",
-            sequence="ACGT",
-        )
-        # Provides values
-        self.assertEqual(bedline.chrom, "chr1")
-        self.assertEqual(bedline.start, 100)
-        self.assertEqual(bedline.end, 200)
-        self.assertEqual(bedline.primername, "scheme_1_LEFT")
-        self.assertEqual(bedline.pool, 1)
-        self.assertEqual(bedline.strand, "+")
-        self.assertEqual(bedline.sequence, "ACGT")
-        self.assertIsNone(bedline.weight)
-
-        # Derived values
-        self.assertEqual(bedline.length, 100)
-        self.assertEqual(bedline.amplicon_number, 1)
-        self.assertEqual(bedline.amplicon_prefix, "scheme")
-        self.assertEqual(bedline.ipool, 0)
+        # (weight, expected weight, expected to_bed weight column)
+        weight_cases = [
+            (None, None, ""),
+            ("", None, ""),
+            (1.0, 1.0, "\t1.0"),
+        ]
+        for weight, expected_weight, weight_col in weight_cases:
+            with self.subTest(weight=weight):
+                bedline = _make_bedline(weight=weight)
+                # Provided and derived values
+                self.assertEqual(
+                    _bedline_fields(bedline),
+                    {
+                        "chrom": "chr1",
+                        "start": 100,
+                        "end": 200,
+                        "primername": "scheme_1_LEFT",
+                        "pool": 1,
+                        "strand": "+",
+                        "sequence": "ACGT",
+                        "weight": expected_weight,
+                        "length": 100,
+                        "amplicon_number": 1,
+                        "amplicon_prefix": "scheme",
+                        "ipool": 0,
+                    },
+                )
+                self.assertEqual(
+                    bedline.to_bed(),
+                    f"chr1\t100\t200\tscheme_1_LEFT\t1\t+\tACGT{weight_col}\n",
+                )
+
+    def test_bedline_slots(self):
+        bedline = _make_bedline()
+        # No per-instance __dict__, so unknown attributes can't be set
+        self.assertFalse(hasattr(bedline, "__dict__"))
+        with self.assertRaises(AttributeError):
+            bedline.not_a_field = 1
+
+    def test_bedline_to_bed_after_update(self):
+        bedline = _make_bedline()
         self.assertEqual(
-            bedline.to_bed(),
-            "chr1\t100\t200\tscheme_1_LEFT\t1\t+\tACGT\n",
+            bedline.to_bed(), "chr1\t100\t200\tscheme_1_LEFT\t1\t+\tACGT\n"
         )
-
-    def test_bedline_create_empty_weight(self):
-        bedline = BedLine(
-            chrom="chr1",
-            start=100,
-            end=200,
-            primername="scheme_1_LEFT",
-            pool=1,
-            strand="+",
-            sequence="ACGT",
-            weight="",
-        )
-        # Provides values
-        self.assertEqual(bedline.chrom, "chr1")
-        self.assertEqual(bedline.start, 100)
-        self.assertEqual(bedline.end, 200)
-        self.assertEqual(bedline.primername, "scheme_1_LEFT")
-        self.assertEqual(bedline.pool, 1)
-        self.assertEqual(bedline.strand, "+")
-        self.assertEqual(bedline.sequence, "ACGT")
-        self.assertIsNone(bedline.weight)
-
-        # Derived values
-        self.assertEqual(bedline.length, 100)
-        self.assertEqual(bedline.amplicon_number, 1)
-        self.assertEqual(bedline.amplicon_prefix, "scheme")
-        self.assertEqual(bedline.ipool, 0)
+        # Setters must clear the cached line
+        bedline.start = 150
+        bedline.primername = "scheme_2_LEFT"
+        bedline.weight = 0.5
         self.assertEqual(
-            bedline.to_bed(),
-            "chr1\t100\t200\tscheme_1_LEFT\t1\t+\tACGT\n",
+            bedline.to_bed(), "chr1\t150\t200\tscheme_2_LEFT\t1\t+\tACGT\t0.5\n"
         )
 
-    def test_bedline_create_weight(self):
-        bedline = BedLine(
-            chrom="chr1",
-            start=100,
-            end=200,
-            primername="scheme_1_LEFT",
-            pool=1,
-            strand="+",
-            sequence="ACGT",
-            weight=1.0,
-        )
-        # Provides values
-        self.assertEqual(bedline.chrom, "chr1")
+    def test_bedline_clone(self):
+        bedline = _make_bedline(weight=1.0)
+        clone = bedline.clone()
+        self.assertIsNot(clone, bedline)
+        self.assertEqual(clone.to_bed(), bedline.to_bed())
+        for slot in BedLine.__slots__:
+            self.assertEqual(getattr(clone, slot), getattr(bedline, slot), slot)
+        self.assertEqual(clone.amplicon_number, 1)
+
+        # Changes to the clone don't affect the original
+        clone.start = 150
+        clone.primername = "scheme_2_LEFT"
         self.assertEqual(bedline.start, 100)
-        self.assertEqual(bedline.end, 200)
         self.assertEqual(bedline.primername, "scheme_1_LEFT")
-        self.assertEqual(bedline.pool, 1)
-        self.assertEqual(bedline.strand, "+")
-        self.assertEqual(bedline.sequence, "ACGT")
-        self.assertEqual(bedline.weight, 1.0)
 
-        # Derived values
-        self.assertEqual(bedline.length, 100)
-        self.assertEqual(bedline.amplicon_number, 1)
-        self.assertEqual(bedline.amplicon_prefix, "scheme")
-        self.assertEqual(bedline.ipool, 0)
-        self.assertEqual(
-            bedline.to_bed(),
-            "chr1\t100\t200\tscheme_1_LEFT\t1\t+\tACGT\t1.0\n",
+    def test_bedline_chrom_interned(self):
+        # Equal chroms share one string object
+        chrom = "".join(["chr", "1"])
+        bedline = _make_bedline(chrom=chrom)
+        _headers, bedlines = BedLineParser.from_str(
+            "chr1\t100\t200\tscheme_1_LEFT\t1\t+\tACGT\n", validate=False
         )
+        self.assertIs(bedline.chrom, bedlines[0].chrom)
 
     def test_invalid_bedline(self):
-        # Fake primername should raise ValueError
-        with self.assertRaises(ValueError):
-            BedLine(
-                chrom="chr1",
-                start=100,
-                end=200,
-                primername="fake_primername",
-                pool=1,
-                strand="+",
-                sequence="ACGT",
-            )
-        # 0-based pool should raise ValueError
-        with self.assertRaises(ValueError):
-            BedLine(
-                chrom="chr1",
-                start=100,
-                end=200,
-                primername="scheme_1_LEFT",
-                pool=0,
-                strand="+",
-                sequence="ACGT",
-            )
-        # Invalid weight should raise ValueError
-        with self.assertRaises(ValueError):
-            BedLine(
-                chrom="chr1",
-                start=100,
-                end=200,
-                primername="scheme_1_LEFT",
-                pool=1,
-                strand="+",
-                sequence="ACGT",
-                weight=-1.0,
-            )
-        # str weight should raise ValueError
-        with self.assertRaises(ValueError):
-            BedLine(
-                chrom="chr1",
-                start=100,
-                end=200,
-                primername="scheme_1_LEFT",
-                pool=1,
-                strand="+",
-                sequence="ACGT",
-                weight="A",
-            )
+        # (field, invalid value, expected error message)
+        invalid_cases = [
+            ("primername", "fake_primername", "Invalid primername"),
+            ("primername", 1, "Invalid primername"),
+            # 0-based pool
+            ("pool", 0, "pool is 1-based"),
+            ("weight", -1.0, "weight must be greater than or equal to 0"),
+            ("weight", "A", "weight must be a float"),
+        ]
+        for field, value, message in invalid_cases:
+            with self.subTest(field=field, value=value):
+                with self.assertRaisesRegex(ValueError, message):
+                    _make_bedline(**{field: value})
 
     def test_bedline_parse_params(self):
         bedline = BedLine(
@@ -184,46 +215,33 @@ class TestBedLine(unittest.TestCase):
         self.assertEqual(bedline.sequence, "ATCG")
 
     def test_bedline_parse_params_invalid(self):
-        valid_bedline = BedLine(
-            chrom="chr1",
-            start="100",
-            end="200",
-            primername="scheme_1_LEFT",
-            pool="1",
-            strand="+",
-            sequence="ATCG",
-        )
-
-        # Invalid pool should raise ValueError
-        with self.assertRaises(ValueError):
-            valid_bedline.pool = "0"
-
-        # Invalid strand should raise ValueError
-        with self.assertRaises(ValueError):
-            valid_bedline.strand = "invalid"
-
-        # Invalid start should raise ValueError
-        with self.assertRaises(ValueError):
-            valid_bedline.start = "invalid"
+        valid_bedline = _make_bedline(start="100", end="200", pool="1", sequence="ATCG")
+
+        # (field, invalid value, expected error message)
+        invalid_cases = [
+            ("pool", "0", "pool is 1-based"),
+            ("strand", "invalid", "strand must be a str of"),
+            ("start", "invalid", "start must be an int"),
+            ("end", "invalid", "end must be an int"),
+            ("primername", "invalid", "Invalid primername"),
+        ]
+        for field, value, message in invalid_cases:
+            with self.subTest(field=field, value=value):
+                with self.assertRaisesRegex(ValueError, message):
+                    setattr(valid_bedline, field, value)
 
-        # Invalid end should raise ValueError
-        with self.assertRaises(ValueError):
-            valid_bedline.end = "invalid"
+    def test_primername_update_amplicon_values(self):
+        bedline = _make_bedline()
+        self.assertEqual(bedline.amplicon_number, 1)
+        self.assertEqual(bedline.amplicon_prefix, "scheme")
 
-        # Invalid primername should raise ValueError
-        with self.assertRaises(ValueError):
-            valid_bedline.primername = "invalid"
+        # Parsed values follow the new primername
+        bedline.primername = "other_12_LEFT_1"
+        self.assertEqual(bedline.amplicon_number, 12)
+        self.assertEqual(bedline.amplicon_prefix, "other")
 
     def test_to_bed(self):
-        bedline = BedLine(
-            chrom="chr1",
-            start=100,
-            end=200,
-            primername="scheme_1_LEFT",
-            pool=1,
-            strand="+",
-            sequence="ACGT",
-        )
+        bedline = _make_bedline()
         self.assertEqual(
             bedline.to_bed(),
             "chr1\t100\t200\tscheme_1_LEFT\t1\t+\tACGT\n",
@@ -236,24 +254,17 @@ class TestBedLine(unittest.TestCase):
         )
 
     def test_weight_setter(self):
-        bedline = BedLine(
-            chrom="chr1",
-            start=100,
-            end=200,
-            primername="scheme_1_LEFT",
-            pool=1,
-            strand="+",
-            sequence="ACGT",
-        )
-        # Str non int
-        with self.assertRaises(ValueError):
-            bedline.weight = "!"
-        # Negative
-        with self.assertRaises(ValueError):
-            bedline.weight = -1.0
-        # Negative Str
-        with self.assertRaises(ValueError):
-            bedline.weight = "-1.0"
+        bedline = _make_bedline()
+        # Str non int, negative and negative str
+        invalid_cases = [
+            ("!", "weight must be a float"),
+            (-1.0, "weight must be greater than or equal to 0"),
+            ("-1.0", "weight must be greater than or equal to 0"),
+        ]
+        for value, message in invalid_cases:
+            with self.subTest(weight=value):
+                with self.assertRaisesRegex(ValueError, message):
+                    bedline.weight = value
 
         # Valid
         bedline.weight = 1.0
@@ -272,38 +283,147 @@ class TestBedLine(unittest.TestCase):
         self.assertIsNone(bedline.weight)
 
 
+class TestVersionPrimername(unittest.TestCase):
+    def test_version_primername(self):
+        self.assertEqual(version_primername("scheme_1_LEFT"), PrimerNameVersion.V1)
+        self.assertEqual(
+            version_primername("scheme_1_RIGHT_alt2"), PrimerNameVersion.V1
+        )
+        self.assertEqual(version_primername("scheme_1_LEFT_1"), PrimerNameVersion.V2)
+        self.assertEqual(
+            version_primername("fake_primername"), PrimerNameVersion.INVALID
+        )
+        self.assertTrue(check_primername("SARS-CoV-2_10_RIGHT_0"))
+        self.assertFalse(check_primername("scheme_1_LEFT_1_2"))
+
+    def test_version_primername_matches_regex(self):
+        """
+        The scanner must agree with the reference regexes
+        """
+        names = [
+            "scheme_1_LEFT",
+            "scheme_1_RIGHT",
+            "SARS-CoV-2_1_LEFT_1",
+            "scheme_01_RIGHT_0",
+            "scheme_1_LEFT_alt",
+            "scheme_1_LEFT_alt1",
+            "scheme_1_LEFT_ALT12",
+            "scheme_1_LEFT_alt1_ALT2",
+            "scheme_1_LEFT_Alt1",
+            "scheme_1_LEFT_alt1a",
+            "scheme_1_LEFT_1_2",
+            "scheme_1_LEFT_",
+            "scheme_1_LEFT__alt",
+            "scheme_1_left",
+            "scheme_1_LEFTalt",
+            "scheme_a_LEFT",
+            "scheme_²_LEFT",
+            "scheme__LEFT",
+            "_1_LEFT",
+            "sch.eme_1_LEFT",
+            "scheme_1",
+            "scheme",
+            "",
+        ]
+        v1_primername_re = re.compile(V1_PRIMERNAME)
+        v2_primername_re = re.compile(V2_PRIMERNAME)
+        for name in names:
+            if v1_primername_re.match(name):
+                expected = PrimerNameVersion.V1
+            elif v2_primername_re.match(name):
+                expected = PrimerNameVersion.V2
+            else:
+                expected = PrimerNameVersion.INVALID
+            self.assertEqual(version_primername(name), expected, name)
+
+
 class TestCreateBedline(unittest.TestCase):
     def test_create_bedline(self):
         bedline = create_bedline(
             ["chr1", "100", "200", "scheme_1_LEFT", "1", "+", "ACGT"]
         )
-        self.assertEqual(bedline.chrom, "chr1")
+        self.assertEqual(_bedline_fields(bedline), _bedline_fields(_make_bedline()))
+
+    def test_create_bedline_too_few_columns(self):
+        with self.assertRaisesRegex(IndexError, "incorrect number of columns"):
+            create_bedline(["chr1", "100", "200", "scheme_1_LEFT", "1", "+"])
+
+    def test_create_bedline_no_validate(self):
+        values = ["chr1", "100", "200", "fake_primername", "1", "+", "acgt"]
+        # Invalid primername raises by default
+        with self.assertRaises(ValueError):
+            create_bedline(values)
+
+        # Skipped when not validating, other fields are still parsed
+        bedline = create_bedline(values, validate=False)
+        self.assertEqual(bedline.primername, "fake_primername")
         self.assertEqual(bedline.start, 100)
-        self.assertEqual(bedline.end, 200)
-        self.assertEqual(bedline.primername, "scheme_1_LEFT")
-        self.assertEqual(bedline.pool, 1)
-        self.assertEqual(bedline.strand, "+")
         self.assertEqual(bedline.sequence, "ACGT")
 
+        # Setting the primername is still validated
+        with self.assertRaises(ValueError):
+            bedline.primername = "invalid"
+
+    def test_create_bedline_no_validate_checks_fields(self):
+        # Only the primername check is skipped
+        valid = ["chr1", "100", "200", "scheme_1_LEFT", "1", "+", "ACGT", "1.0"]
+        invalid_cases = [
+            ("start", "-5", "start must be greater than or equal to 0"),
+            ("end", "x", "end must be an int"),
+            ("pool", "0", "pool is 1-based"),
+            ("strand", ".", "strand must be a str of"),
+            ("weight", "-1", "weight must be greater than or equal to 0"),
+        ]
+        for field, value, message in invalid_cases:
+            values = valid.copy()
+            values[BEDLINE_FIELDS.index(field)] = value
+            # The setter raises the exact same error
+            with self.assertRaisesRegex(ValueError, message) as setter_error:
+                _make_bedline(**{field: value})
+            for validate in (True, False):
+                with self.subTest(field=field, validate=validate):
+                    with self.assertRaises(ValueError) as error:
+                        create_bedline(values, validate=validate)
+                    self.assertEqual(str(error.exception), str(setter_error.exception))
+
 
 class TestReadBedfile(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.headers, cls.bedlines = _read_test_bedfile(TEST_BEDFILE)
+        cls.v2_headers, cls.v2_bedlines = _read_test_bedfile(TEST_V2_BEDFILE)
+
     def test_read_bedfile(self):
-        headers, bedlines = read_bedfile(TEST_BEDFILE)
         self.assertEqual(
-            headers, ["# artic-bed-version v3.0", "# artic-sars-cov-2 / 400 / v5.3.2"]
+            self.headers,
+            ["# artic-bed-version v3.0", "# artic-sars-cov-2 / 400 / v5.3.2"],
         )
 
+        self.assertEqual(len(self.bedlines), 6)
+        self.assertEqual(self.bedlines[0].chrom, "MN908947.3")
+
+    def test_parse_bedfile_lines(self):
+        with open(TEST_BEDFILE) as f:
+            headers, bedlines = parse_bedfile_lines(f)
+        self.assertEqual(
+            headers, ["# artic-bed-version v3.0", "# artic-sars-cov-2 / 400 / v5.3.2"]
+        )
         self.assertEqual(len(bedlines), 6)
-        self.assertEqual(bedlines[0].chrom, "MN908947.3")
+
+    def test_read_bedfile_no_validate(self):
+        _headers, trusted_bedlines = read_bedfile(TEST_BEDFILE, validate=False)
+        self.assertEqual(
+            "".join(bl.to_bed() for bl in trusted_bedlines),
+            "".join(bl.to_bed() for bl in self.bedlines),
+        )
 
     def test_read_v2_bedfile(self):
-        headers, bedlines = read_bedfile(TEST_V2_BEDFILE)
         # Check for empty headers
-        self.assertEqual(headers, [])
+        self.assertEqual(self.v2_headers, [])
 
         # Check correct number of bedlines and chrom
-        self.assertEqual(len(bedlines), 10)
-        self.assertEqual(bedlines[0].chrom, "MN908947.3")
+        self.assertEqual(len(self.v2_bedlines), 10)
+        self.assertEqual(self.v2_bedlines[0].chrom, "MN908947.3")
 
     def test_read_weight_bedline(self):
         headers, bedlines = read_bedfile(TEST_WEIGHTS_BEDFILE)
@@ -316,15 +436,7 @@ class TestReadBedfile(unittest.TestCase):
 
 
 class TestCreateBedfileStr(unittest.TestCase):
-    bedline = BedLine(
-        chrom="chr1",
-        start=100,
-        end=200,
-        primername="scheme_1_LEFT",
-        pool=1,
-        strand="+",
-        sequence="ACGT",
-    )
+    bedline = _make_bedline()
 
     def test_create_bedfile_str(self):
         bedfile_str = create_bedfile_str(["#header1"], [self.bedline])
@@ -336,6 +448,27 @@ class TestCreateBedfileStr(unittest.TestCase):
         bedfile_str = create_bedfile_str([], [self.bedline])
         self.assertEqual(bedfile_str, "chr1\t100\t200\tscheme_1_LEFT\t1\t+\tACGT\n")
 
+    def test_create_bedfile_str_weight(self):
+        bedline = _make_bedline(weight=1.0)
+        bedfile_str = create_bedfile_str(["#header1"], [bedline])
+        self.assertEqual(
+            bedfile_str, "#header1\nchr1\t100\t200\tscheme_1_LEFT\t1\t+\tACGT\t1.0\n"
+        )
+
+    def test_create_bedfile_str_multiple(self):
+        bedlines = [
+            _make_bedline(),
+            _make_bedline(start=300, end=320, primername="scheme_1_RIGHT", strand="-"),
+            _make_bedline(primername="scheme_2_LEFT", pool=2, weight=0.5),
+        ]
+        expected = (
+            "#header1\n"
+            "chr1\t100\t200\tscheme_1_LEFT\t1\t+\tACGT\n"
+            "chr1\t300\t320\tscheme_1_RIGHT\t1\t-\tACGT\n"
+            "chr1\t100\t200\tscheme_2_LEFT\t2\t+\tACGT\t0.5\n"
+        )
+        self.assertEqual(create_bedfile_str(["#header1"], bedlines), expected)
+
     def test_create_bedfile_str_malformed_header(self):
         bedfile_str = create_bedfile_str(["header1"], [self.bedline])
         self.assertEqual(
@@ -343,60 +476,34 @@ class TestCreateBedfileStr(unittest.TestCase):
         )
 
 
-class TestWriteBedfile(unittest.TestCase):
-    output_bed_path = pathlib.Path(__file__).parent / "test_output.bed"
-
+class TestWriteBedfile(_TempOutputMixin, unittest.TestCase):
     def test_write_bedfile(self):
-        bedline = BedLine(
-            chrom="chr1",
-            start=100,
-            end=200,
-            primername="scheme_1_LEFT",
-            pool=1,
-            strand="+",
-            sequence="ACGT",
-        )
-        # Write non-weighted bedline
-        write_bedfile(self.output_bed_path, ["#header1"], [bedline])
-        with open(self.output_bed_path) as f:
-            content = f.read()
-        self.assertEqual(
-            content, "#header1\nchr1\t100\t200\tscheme_1_LEFT\t1\t+\tACGT\n"
-        )
-        # Write weighted bedline
-        bedline.weight = 1.0
-        write_bedfile(self.output_bed_path, ["#header1"], [bedline])
+        bedlines = [
+            _make_bedline(),
+            _make_bedline(primername="scheme_1_RIGHT", strand="-", weight=1.0),
+        ]
+        # Formatting is covered by TestCreateBedfileStr, so only round trip to disk once
+        write_bedfile(self.output_bed_path, ["#header1"], bedlines)
         with open(self.output_bed_path) as f:
             content = f.read()
         self.assertEqual(
-            content, "#header1\nchr1\t100\t200\tscheme_1_LEFT\t1\t+\tACGT\t1.0\n"
+            content,
+            "#header1\n"
+            "chr1\t100\t200\tscheme_1_LEFT\t1\t+\tACGT\n"
+            "chr1\t100\t200\tscheme_1_RIGHT\t1\t-\tACGT\t1.0\n",
         )
 
-    def tearDown(self) -> None:
-        # Remove output file
-        self.output_bed_path.unlink(missing_ok=True)
-        super().tearDown()
-
 
 class TestGroupByChrom(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.bedlines = _read_test_bedfile(TEST_BEDFILE)[1]
+        cls.v2_bedlines = _read_test_bedfile(TEST_V2_BEDFILE)[1]
+
     def test_group_by_chrom(self):
-        bedline1 = BedLine(
-            chrom="chr1",
-            start=100,
-            end=200,
-            primername="scheme_1_LEFT",
-            pool=1,
-            strand="+",
-            sequence="ACGT",
-        )
-        bedline2 = BedLine(
-            chrom="chr2",
-            start=150,
-            end=250,
-            primername="scheme_2_LEFT",
-            pool=2,
-            strand="+",
-            sequence="ACGT",
+        bedline1 = _make_bedline()
+        bedline2 = _make_bedline(
+            chrom="chr2", start=150, end=250, primername="scheme_2_LEFT", pool=2
         )
         grouped = group_by_chrom([bedline1, bedline2])
         self.assertEqual(len(grouped), 2)
@@ -413,8 +520,7 @@ class TestGroupByChrom(unittest.TestCase):
         """
         Tests grouping by chrom for a v3 (default) bedfile
         """
-        headers, bedlines = read_bedfile(TEST_BEDFILE)
-        grouped = group_by_chrom(bedlines)
+        grouped = group_by_chrom(self.bedlines)
         self.assertEqual(len(grouped), 1)
         self.assertEqual(len(grouped["MN908947.3"]), 6)
 
@@ -422,32 +528,19 @@ class TestGroupByChrom(unittest.TestCase):
         """
         Tests grouping by chrom for a v2 bedfile
         """
-        headers, bedlines = read_bedfile(TEST_V2_BEDFILE)
-        grouped = group_by_chrom(bedlines)
+        grouped = group_by_chrom(self.v2_bedlines)
         self.assertEqual(len(grouped), 1)
         self.assertEqual(len(grouped["MN908947.3"]), 10)
 
 
 class TestGroupByAmpliconNumber(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.bedlines = _read_test_bedfile(TEST_BEDFILE)[1]
+
     def test_group_by_amplicon_number(self):
-        bedline1 = BedLine(
-            chrom="chr1",
-            start=100,
-            end=200,
-            primername="scheme_1_LEFT",
-            pool=1,
-            strand="+",
-            sequence="ACGT",
-        )
-        bedline2 = BedLine(
-            chrom="chr1",
-            start=150,
-            end=250,
-            primername="scheme_1_LEFT",
-            pool=2,
-            strand="+",
-            sequence="ACGT",
-        )
+        bedline1 = _make_bedline()
+        bedline2 = _make_bedline(start=150, end=250, pool=2)
         grouped = group_by_amplicon_number([bedline1, bedline2])
         self.assertEqual(len(grouped), 1)
         self.assertEqual(len(grouped[1]), 2)
@@ -455,8 +548,7 @@ class TestGroupByAmpliconNumber(unittest.TestCase):
         self.assertEqual(grouped[1][1].chrom, "chr1")
 
     def test_group_by_amplicon_number_file(self):
-        headers, bedlines = read_bedfile(TEST_BEDFILE)
-        grouped = group_by_amplicon_number(bedlines)
+        grouped = group_by_amplicon_number(self.bedlines)
         self.assertEqual(len(grouped), 3)
 
         # Check for correct ampliconnumber
@@ -465,39 +557,29 @@ class TestGroupByAmpliconNumber(unittest.TestCase):
                 self.assertEqual(bedline.amplicon_number, amplicon_number)
 
         # Check for correct primernames
+        primernames = {
+            amplicon_number: {bl.primername for bl in bedlines}
+            for amplicon_number, bedlines in grouped.items()
+        }
         self.assertEqual(
-            {bl.primername for bl in grouped[1]},
-            {"SARS-CoV-2_1_LEFT_1", "SARS-CoV-2_1_RIGHT_1"},
-        )
-        self.assertEqual(
-            {bl.primername for bl in grouped[2]},
-            {"SARS-CoV-2_2_LEFT_0", "SARS-CoV-2_2_RIGHT_0"},
-        )
-        self.assertEqual(
-            {bl.primername for bl in grouped[3]},
-            {"SARS-CoV-2_3_LEFT_1", "SARS-CoV-2_3_RIGHT_0"},
+            primernames,
+            {
+                1: {"SARS-CoV-2_1_LEFT_1", "SARS-CoV-2_1_RIGHT_1"},
+                2: {"SARS-CoV-2_2_LEFT_0", "SARS-CoV-2_2_RIGHT_0"},
+                3: {"SARS-CoV-2_3_LEFT_1", "SARS-CoV-2_3_RIGHT_0"},
+            },
         )
 
 
 class TestGroupByStrand(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.bedlines = _read_test_bedfile(TEST_BEDFILE)[1]
+
     def test_group_by_strand(self):
-        bedline1 = BedLine(
-            chrom="chr1",
-            start=100,
-            end=200,
-            primername="scheme_1_LEFT",
-            pool=1,
-            strand="+",
-            sequence="ACGT",
-        )
-        bedline2 = BedLine(
-            chrom="chr1",
-            start=150,
-            end=250,
-            primername="scheme_1_RIGHT",
-            pool=2,
-            strand="-",
-            sequence="ACGT",
+        bedline1 = _make_bedline()
+        bedline2 = _make_bedline(
+            start=150, end=250, primername="scheme_1_RIGHT", pool=2, strand="-"
         )
         grouped = group_by_strand([bedline1, bedline2])
         self.assertEqual(len(grouped), 2)
@@ -507,16 +589,13 @@ class TestGroupByStrand(unittest.TestCase):
         self.assertEqual(grouped["-"], [bedline2])
 
     def test_group_by_strand_file(self):
-        headers, bedlines = read_bedfile(TEST_BEDFILE)
-        grouped = group_by_strand(bedlines)
+        grouped = group_by_strand(self.bedlines)
         self.assertEqual(len(grouped), 2)
         self.assertEqual(len(grouped["+"]), 3)
         self.assertEqual(len(grouped["-"]), 3)
 
 
-class TestBedLineParser(unittest.TestCase):
-    OUTFILE = pathlib.Path(__file__).parent / "test_bedline_parser_to_file.bed"
-
+class TestBedLineParser(_TempOutputMixin, unittest.TestCase):
     def test_bedline_parser_from_file(self):
         headers, bedlines = BedLineParser.from_file(TEST_BEDFILE)
         self.assertEqual(
@@ -537,48 +616,48 @@ class TestBedLineParser(unittest.TestCase):
         self.assertEqual(len(bedlines), 6)
         self.assertEqual(bedlines[0].chrom, "MN908947.3")
 
-    def test_bedline_parser_to_str(self):
-        bedline = BedLine(
-            chrom="chr1",
-            start=100,
-            end=200,
-            primername="scheme_1_LEFT",
-            pool=1,
-            strand="+",
-            sequence="ACGT",
+    def test_bedline_parser_from_str_bom(self):
+        with open(TEST_BEDFILE) as f:
+            bedfile_str = f.read()
+        headers, bedlines = BedLineParser.from_str("\ufeff" + bedfile_str)
+        self.assertEqual(
+            headers, ["# artic-bed-version v3.0", "# artic-sars-cov-2 / 400 / v5.3.2"]
         )
+        self.assertEqual(len(bedlines), 6)
+
+    def test_bedline_parser_from_str_crlf(self):
+        with open(TEST_BEDFILE) as f:
+            bedfile_str = f.read()
+        headers, bedlines = BedLineParser.from_str(bedfile_str.replace("\n", "\r\n"))
+        self.assertEqual(len(headers), 2)
+        self.assertEqual(len(bedlines), 6)
+        self.assertFalse(bedlines[-1].sequence.endswith("\r"))
+
+    def test_bedline_parser_to_str(self):
+        bedline = _make_bedline()
         bedfile_str = BedLineParser.to_str(["#header1"], [bedline])
         self.assertEqual(
             bedfile_str, "#header1\nchr1\t100\t200\tscheme_1_LEFT\t1\t+\tACGT\n"
         )
 
     def test_bedline_parser_to_file(self):
-        bedline = BedLine(
-            chrom="chr1",
-            start=100,
-            end=200,
-            primername="scheme_1_LEFT",
-            pool=1,
-            strand="+",
-            sequence="ACGT",
-        )
-        BedLineParser.to_file(self.OUTFILE, ["#header1"], [bedline])
-        with open(self.OUTFILE) as f:
+        bedline = _make_bedline()
+        BedLineParser.to_file(self.output_bed_path, ["#header1"], [bedline])
+        with open(self.output_bed_path) as f:
             content = f.read()
         self.assertEqual(
             content, "#header1\nchr1\t100\t200\tscheme_1_LEFT\t1\t+\tACGT\n"
         )
 
-    def tearDown(self) -> None:
-        self.OUTFILE.unlink(missing_ok=True)
-        super().tearDown()
-
 
 class TestModifyBedLines(unittest.TestCase):
-    v2_bedlines = BedLineParser.from_file(TEST_V2_BEDFILE)[1]
+    @classmethod
+    def setUpClass(cls):
+        # Read at test run, not at import. Tests that modify these must clone them
+        cls.v2_bedlines = _read_test_bedfile(TEST_V2_BEDFILE)[1]
 
     def test_update_primername_simple(self):
-        local_v2_bedlines = copy.deepcopy(self.v2_bedlines)
+        local_v2_bedlines = [bl.clone() for bl in self.v2_bedlines]
         old_bednames = {bl.primername for bl in local_v2_bedlines}
 
         # Update primernames
@@ -615,24 +694,8 @@ class TestModifyBedLines(unittest.TestCase):
 
     def test_update_primername_alt(self):
         bedlines = [
-            BedLine(
-                chrom="chr1",
-                start=100,
-                end=200,
-                primername="test_1_LEFT_alt",
-                pool=1,
-                strand="+",
-                sequence="ACGT",
-            ),
-            BedLine(
-                chrom="chr1",
-                start=100,
-                end=200,
-                primername="test_1_LEFT",
-                pool=1,
-                strand="+",
-                sequence="ACGT",
-            ),
+            _make_bedline(primername="test_1_LEFT_alt"),
+            _make_bedline(primername="test_1_LEFT"),
         ]
         new_bedlines = update_primernames(bedlines)
         new_primername = {bl.primername for bl in new_bedlines}
@@ -640,24 +703,8 @@ class TestModifyBedLines(unittest.TestCase):
 
     def test_downgrade_primername(self):
         bedlines = [
-            BedLine(
-                chrom="chr1",
-                start=100,
-                end=200,
-                primername="test_1_LEFT",
-                pool=1,
-                strand="+",
-                sequence="ACGT",
-            ),
-            BedLine(
-                chrom="chr1",
-                start=100,
-                end=200,
-                primername="test_1_LEFT_alt",
-                pool=1,
-                strand="+",
-                sequence="ACGT",
-            ),
+            _make_bedline(primername="test_1_LEFT"),
+            _make_bedline(primername="test_1_LEFT_alt"),
         ]
         new_bedlines = downgrade_primernames(bedlines)
         new_primername = {bl.primername for bl in new_bedlines}
@@ -665,11 +712,11 @@ class TestModifyBedLines(unittest.TestCase):
 
     def test_sort_bedlines(self):
         # Read in a bedfile
-        headers, bedlines = BedLineParser.from_file(TEST_BEDFILE)
+        headers, bedlines = _read_test_bedfile(TEST_BEDFILE)
 
         # Randomly shuffle the bedlines
-        random.seed(100)
-        random_bedlines = random.sample(bedlines, len(bedlines))
+        random_bedlines = bedlines[:]
+        random.Random(100).shuffle(random_bedlines)
 
         # Sort the bedlines
         sorted_bedlines = sort_bedlines(random_bedlines)
@@ -677,26 +724,19 @@ class TestModifyBedLines(unittest.TestCase):
         # Check that the bedlines are sorted
         self.assertEqual(sorted_bedlines, bedlines)
 
+    def test_sort_bedlines_reverse_only(self):
+        # Amplicons with only reverse primers can still be sorted
+        bedlines = [
+            BedLine("chr1", 300, 320, "test_2_RIGHT_1", 1, "-", "ACGT"),
+            BedLine("chr1", 100, 120, "test_1_LEFT_1", 1, "+", "ACGT"),
+        ]
+        sorted_bedlines = sort_bedlines(bedlines)
+        self.assertEqual(sorted_bedlines, bedlines[::-1])
+
     def test_merge_bedlines_single(self):
         bedlines = [
-            BedLine(
-                chrom="chr1",
-                start=100,
-                end=120,
-                primername="test_1_RIGHT_1",
-                pool=1,
-                strand="-",
-                sequence="ACGT",
-            ),
-            BedLine(
-                chrom="chr1",
-                start=110,
-                end=130,
-                primername="test_1_RIGHT_2",
-                pool=1,
-                strand="-",
-                sequence="ACGT",
-            ),
+            _make_bedline(end=120, primername="test_1_RIGHT_1", strand="-"),
+            _make_bedline(start=110, end=130, primername="test_1_RIGHT_2", strand="-"),
         ]
         merged_bedlines = merge_bedlines(bedlines)
         # Check merged bedline
@@ -711,26 +751,23 @@ class TestModifyBedLines(unittest.TestCase):
         self.assertEqual(merged_bedline.pool, 1)
         self.assertEqual(merged_bedline.strand, "-")
 
+    def test_merge_bedlines_longest_sequence(self):
+        bedlines = [
+            BedLine("chr1", 100, 120, "test_1_LEFT_1", 1, "+", "ACGT"),
+            BedLine("chr1", 90, 110, "test_1_LEFT_2", 1, "+", "ACGTAA"),
+            BedLine("chr1", 95, 125, "test_1_LEFT_3", 1, "+", "TTTTTT"),
+        ]
+        merged_bedlines = merge_bedlines(bedlines)
+        self.assertEqual(len(merged_bedlines), 1)
+        self.assertEqual(merged_bedlines[0].start, 90)
+        self.assertEqual(merged_bedlines[0].end, 125)
+        # The first of the longest sequences is kept
+        self.assertEqual(merged_bedlines[0].sequence, "ACGTAA")
+
     def test_merge_bedlines_nothing(self):
         bedlines = [
-            BedLine(
-                chrom="chr1",
-                start=100,
-                end=120,
-                primername="test_1_LEFT_1",
-                pool=1,
-                strand="+",
-                sequence="ACGT",
-            ),
-            BedLine(
-                chrom="chr1",
-                start=110,
-                end=130,
-                primername="test_1_RIGHT_2",
-                pool=1,
-                strand="-",
-                sequence="ACGT",
-            ),
+            _make_bedline(end=120, primername="test_1_LEFT_1"),
+            _make_bedline(start=110, end=130, primername="test_1_RIGHT_2", strand="-"),
         ]
         merged_bedlines = merge_bedlines(bedlines)
 
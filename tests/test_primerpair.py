@@ -4,11 +4,14 @@ import unittest
 from primalbedtools.bedfiles import BedLine, BedLineParser, group_primer_pairs
 from primalbedtools.primerpairs import PrimerPair
 
+TEST_BEDFILE = pathlib.Path(__file__).parent / "test.bed"
+
 
 class TestPrimerPair(unittest.TestCase):
-    # Read in basic bed file
-    test_bedline = pathlib.Path("tests/test.bed")
-    _test_headers, test_bedlines = BedLineParser.from_file(test_bedline)
+    @classmethod
+    def setUpClass(cls):
+        # Read in basic bed file once, at test run rather than import
+        cls._test_headers, cls.test_bedlines = BedLineParser.from_file(TEST_BEDFILE)
 
     def test_group_primerpairs(self):
         # Test grouping of primer pairs
@@ -17,6 +20,25 @@ class TestPrimerPair(unittest.TestCase):
         # Check correct number
         self.assertEqual(len(primer_pairs), 3)
 
+    def test_group_primerpairs_order(self):
+        # Interleaved chroms are grouped by chrom, then amplicon number
+        bedlines = [
+            BedLine("chrom1", 100, 120, "test_1_LEFT_1", 1, "+", "ATGC"),
+            BedLine("chrom2", 100, 120, "test_1_LEFT_1", 1, "+", "ATGC"),
+            BedLine("chrom1", 300, 320, "test_2_LEFT_1", 2, "+", "ATGC"),
+            BedLine("chrom1", 200, 220, "test_1_RIGHT_1", 1, "-", "ATGC"),
+        ]
+        primer_pairs = group_primer_pairs(bedlines)
+
+        self.assertEqual(
+            primer_pairs,
+            [
+                ([bedlines[0]], [bedlines[3]]),
+                ([bedlines[2]], []),
+                ([bedlines[1]], []),
+            ],
+        )
+
     def test_primer_pair_creation(self):
         # Test creation of primer pairs
         fbedline = BedLine("chrom", 100, 120, "test_1_LEFT_1", 1, "+", "ATGC")